@@ -11,7 +11,10 @@ WINDOW_RESIZABLE = True
 
 WORKSPACE_PADDING = 50
 
-TARGET_GUI_FRAMERATE = 240
+CLICK_COOLDOWN_MS = 16  # Minimum time between handled workspace clicks
+NAIL_OVERLAY_THRESHOLD = 2000  # Nails drawn into the image at or above this count
+
+PNG_COMPRESS_LEVEL = 1  # zlib level for exported PNGs, 1 is fastest, 9 is smallest
 
 BACKGROUND_COLOR = (255, 255, 255)  # RGB
 
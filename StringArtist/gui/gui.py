@@ -1,16 +1,19 @@
+import base64
 import functools
-import json
 import logging
 import math
+import threading
+import time
 import tkinter as tk
 import tkinter.filedialog
 from pathlib import Path
 from tkinter import messagebox
 
-from PIL import Image, ImageTk
-from typing import Union, List
+from typing import Union, TYPE_CHECKING
 
-from PIL.PngImagePlugin import PngInfo
+# PIL is imported where it's used so the window can open before it has loaded
+if TYPE_CHECKING:
+    from PIL import Image, ImageTk
 
 from StringArtist.config import (
     WINDOW_HEIGHT,
@@ -19,12 +22,16 @@ from StringArtist.config import (
     WORKSPACE_PADDING,
     ICON,
     STRING_FILENAME,
+    CLICK_COOLDOWN_MS,
+    NAIL_OVERLAY_THRESHOLD,
+    PNG_COMPRESS_LEVEL,
 )
 from StringArtist.gui.placements import (
-    Placement,
-    placements_from_json,
-    placements_to_json,
+    PlacementArray,
+    placements_to_bytes,
     PlacementLoadError,
+    placements_from_info,
+    PIN_VERSION,
 )
 
 logger = logging.getLogger("gui.py")
@@ -43,17 +50,33 @@ TOOLS = [
     "Background",
 ]
 
+TOOL_INDEX = {tool: idx for idx, tool in enumerate(TOOLS)}
 
-def scale_to_fit(image: Image.Image, x: int, y: int) -> Image.Image:
+# Canvas tag on every nail, so redraws can remove them while keeping the background item
+NAIL_TAG = "nail"
+
+KEYBINDS = {
+    "n": "Nail",
+    "e": "Erase",
+    "p": "Prioritize",
+    "b": "Background",
+    "i": "Import Positions",
+}
+
+
+def scale_to_fit(image: "Image.Image", x: int, y: int) -> "Image.Image":
     """
     Scales the image to fit within a box of dimensions of the canvas while maintaining aspect ratio.
+    Uses BILINEAR as this is only the workspace preview, exports resample the source with LANCZOS.
 
     :param image: A PIL Image
     :param x: Maximum width of the bounding box
     :param y: Maximum height of the bounding box
     :return: A new resized PIL Image instance.
     """
-    image.thumbnail((x, y), Image.Resampling.LANCZOS)
+    from PIL import Image
+
+    image.thumbnail((x, y), Image.Resampling.BILINEAR, reducing_gap=2.0)
     return image
 
 
@@ -78,19 +101,70 @@ class GUI:
         self.toolbar_widgets: list = []
         self.selected_tool = -1
 
+        # Tools that run an action instead of becoming the selected tool
+        self._tool_handlers = {
+            "Background": self.background_tool_callback,
+            "Export Positions / Save": self.export_positions_callback,
+            "Import Positions": self.import_positions_callback,
+        }
+
+        # Workspace click handlers keyed by GUI.selected_tool
+        self._click_handlers = {
+            TOOL_INDEX["Nail"]: self.nail_click_callback,
+            TOOL_INDEX["Erase"]: self.erase_click_callback,
+            TOOL_INDEX["Prioritize"]: self.prioritize_click_callback,
+        }
+
         self.workspace_frame: Union[tk.Frame, None] = None
         self.workspace_canvas: Union[tk.Canvas, None] = None
 
         self.working_im: Union[Image, None] = None
         self.im_path: Union[str, None] = None
         self.im_scale: float = 1
+        # 1 / im_scale as an integer ratio, so image -> canvas space needs no float math
+        self._scale_num: int = 1
+        self._scale_den: int = 1
 
         self.draw_toolbar()
         self.draw_workspace()
 
-        self.placements: List[Placement] = []
+        # Created by GUI.placements on first use, so numpy loads after the window opens
+        self._placements: Union[PlacementArray, None] = None
         self.priority_nail: int = 0
 
+        # Imported (mtime, image width, placements) keyed by path so re-importing skips
+        # decoding, one entry per file that is replaced once the file changes
+        self._placements_cache: dict[str, tuple[float, int, PlacementArray]] = {}
+
+        self._redraw_pending: bool = False
+        self._preloaded_im: Union["Image.Image", None] = None
+        self._last_click_ts: float = 0.0
+        # The save running on a worker thread, at most one at a time as they write
+        # the same file
+        self._export_thread: Union[threading.Thread, None] = None
+
+        self._im_cache_key: Union[tuple, None] = None
+        self._im_cache_tk: Union[ImageTk.PhotoImage, None] = None
+        self._im_cache_pil: Union[Image.Image, None] = None
+        self._bg_item: Union[int, None] = None
+        self._bg_has_nails: bool = False
+
+    @property
+    def placements(self) -> PlacementArray:
+        """
+        The nails placed on the current image, created empty the first time it's used
+        :return: PlacementArray
+        """
+
+        if self._placements is None:
+            self._placements = PlacementArray()
+
+        return self._placements
+
+    @placements.setter
+    def placements(self, placements: PlacementArray) -> None:
+        self._placements = placements
+
     @property
     def active_tool(self) -> str | None:
         """
@@ -110,12 +184,9 @@ class GUI:
         :return:
         """
 
-        if TOOLS[idx] == "Background":
-            return self.background_tool_callback()
-        elif TOOLS[idx] == "Export Positions / Save":
-            return self.export_positions_callback()
-        elif TOOLS[idx] == "Import Positions":
-            return self.import_positions_callback()
+        handler = self._tool_handlers.get(TOOLS[idx])
+        if handler is not None:
+            return handler()
 
         old_btn = (
             self.toolbar_widgets[self.selected_tool]
@@ -131,6 +202,21 @@ class GUI:
 
         btn.configure(background="#dbdbdb")
 
+    def set_im_scale(self, im_width: int, canvas_width: int) -> None:
+        """
+        Sets the image:canvas ratio, images are never scaled up so it is at least 1
+        :param im_width: The width of the source image
+        :param canvas_width: The width of the canvas
+        :return: None
+        """
+
+        if im_width > canvas_width:
+            self._scale_num, self._scale_den = canvas_width, im_width
+        else:
+            self._scale_num, self._scale_den = 1, 1
+
+        self.im_scale = self._scale_den / self._scale_num
+
     def scale_coordinate(self, j: int, scale: float = None) -> int:
         """
         Scales a coordinate to the image:canvas ratio
@@ -149,6 +235,10 @@ class GUI:
         :return: None
         """
 
+        if self._export_thread is not None and self._export_thread.is_alive():
+            logger.info("Ignoring export, the previous one is still saving")
+            return
+
         if len(self.placements) < 3:
             messagebox.showinfo(
                 "Not Enough Points",
@@ -157,7 +247,9 @@ class GUI:
             return
 
         try:
-            data = placements_to_json(self.placements, 1 / self.im_scale)
+            data = placements_to_bytes(
+                self.placements, self._scale_num, self._scale_den
+            )
         except PlacementLoadError as e:
             messagebox.showinfo("Load failed", str(e))
             return
@@ -168,9 +260,65 @@ class GUI:
 
         path = path + STRING_FILENAME
 
+        from PIL import Image
+        from PIL.PngImagePlugin import PngInfo
+
         metadata = PngInfo()
-        metadata.add_text("pins", json.dumps(data))
-        self.working_im.save(path, pnginfo=metadata, format="png")
+        metadata.add_text("pins_v", PIN_VERSION)
+        metadata.add_text("pins_b64", base64.b64encode(data).decode())
+
+        source_path = self.im_path
+        size = self.working_im.size
+        errors: list[Exception] = []
+
+        def save() -> None:
+            try:
+                # The workspace image is only a preview, resample the source again with
+                # LANCZOS for the saved file. Resized to exactly the preview's size, the
+                # pins are stored in its coordinates
+                with Image.open(source_path) as source:
+                    export_im = source.convert(mode="RGBA").resize(
+                        size, Image.Resampling.LANCZOS
+                    )
+
+                export_im.save(
+                    path,
+                    pnginfo=metadata,
+                    format="png",
+                    compress_level=PNG_COMPRESS_LEVEL,
+                    optimize=False,
+                )
+            except Exception as e:
+                errors.append(e)
+
+        # Pillow releases the GIL while resampling and compressing, so saving off the
+        # Tk thread keeps the UI responsive
+
+        self._export_thread = threading.Thread(target=save)
+        self._export_thread.start()
+        self.poll_export(self._export_thread, path, errors)
+
+    def poll_export(
+        self, thread: threading.Thread, path: str, errors: list[Exception]
+    ) -> None:
+        """
+        Waits for an export started by export_positions_callback without blocking Tk, then reports the result
+        :param thread: The thread saving the file
+        :param path: The path being saved to
+        :param errors: Filled with the exception if the save failed
+        :return: None
+        """
+
+        if thread.is_alive():
+            self.root.after(50, self.poll_export, thread, path, errors)
+            return
+
+        self._export_thread = None
+
+        if errors:
+            logger.error(f"Failed to save {path}: {errors[0]}")
+            messagebox.showinfo("Save failed", str(errors[0]))
+            return
 
         messagebox.showinfo("File Saved", f"File saved to {path}")
 
@@ -184,21 +332,45 @@ class GUI:
             messagebox.showinfo("Import Error", f"Couldn't find file {path}!")
             return
 
-        self.im_path = str(path)
+        from PIL import Image
 
-        im = Image.open(self.im_path)
-        im.load()
+        mtime = path.stat().st_mtime
+        cached = self._placements_cache.get(str(path))
+        im = None
 
-        im_width = im.width
-        self.im_scale = max(1.0, im_width / self.workspace_canvas.winfo_width())
+        if cached is not None and cached[0] == mtime:
+            logger.debug(f"Reusing cached placements for {path}")
+            _, im_width, placements = cached
+        else:
+            im = Image.open(path)
+            im.load()
 
-        placements = placements_from_json(json.loads(im.info["pins"]))
+            im_width = im.width
 
-        im.close()
+            try:
+                placements = placements_from_info(im.info)
+            except PlacementLoadError as e:
+                messagebox.showinfo("Import Error", str(e))
+                return
 
-        self.placements.clear()
-        self.placements.extend(placements)
-        self.redraw_canvas()
+            self._placements_cache[str(path)] = (mtime, im_width, placements)
+
+        self.im_path = str(path)
+        # The file may have been re-exported under the same path, never trust the cache
+        self._im_cache_key = None
+
+        self.set_im_scale(im_width, self.workspace_canvas.winfo_width())
+
+        import numpy as np
+
+        # Copied so editing the nails doesn't change the cached ones
+        placements = placements.copy()
+        self.placements = placements
+        priority_nails = np.flatnonzero(placements.priority)
+        self.priority_nail = int(priority_nails[0]) if len(priority_nails) > 0 else 0
+
+        # The image is already decoded, hand it over so the redraw doesn't read it again
+        self.redraw_canvas(preloaded_im=im)
 
     def background_tool_callback(self) -> None:
         """
@@ -219,43 +391,56 @@ class GUI:
             logger.info(f'No image at path "{filepath}"')
             return
 
+        from PIL import Image, UnidentifiedImageError
+
+        # Opening only reads the header, the redraw decodes the image this hands it
+        try:
+            im = Image.open(filepath)
+        except (OSError, UnidentifiedImageError) as e:
+            logger.warning(f'Failed to open image "{filepath}": {e}')
+            messagebox.showinfo("Background Error", f"Couldn't open image {filepath}!")
+            return
+
         self.placements.clear()
+        self.priority_nail = 0
 
-        im = Image.open(filepath)
-        im.close()
         self.im_path = filepath
+        self._im_cache_key = None
 
-        self.redraw_canvas()
+        self.redraw_canvas(preloaded_im=im)
 
     def keybind_callback(self, event) -> None:
         char = event.char.lower()
 
-        if char == "n":
-            self.tool_select_callback(TOOLS.index("Nail"))
-        elif char == "e":
-            self.tool_select_callback(TOOLS.index("Erase"))
-        elif char == "p":
-            self.tool_select_callback(TOOLS.index("Prioritize"))
-        elif char == "b":
-            self.tool_select_callback(TOOLS.index("Background"))
-        elif char == "i":
-            self.tool_select_callback(TOOLS.index("Import Positions"))
+        tool = KEYBINDS.get(char)
+        if tool is not None:
+            self.tool_select_callback(TOOL_INDEX[tool])
         elif (event.state == 8 and char == "s") or (
             event.state == 44 and char == "\x13"
         ):  # ctrl+s/commands+s
-            self.tool_select_callback(TOOLS.index("Export Positions / Save"))
+            self.tool_select_callback(TOOL_INDEX["Export Positions / Save"])
 
     def workspace_click_callback(self, event) -> bool:
         """
-        The callback that handles the workspace being clicked
+        The callback that handles the workspace being clicked, clicks within CLICK_COOLDOWN_MS of the last are deferred
         :param event: The click event
-        :return: True on success False on fail.
+        :return: True on success or when deferred, False on fail.
         """
 
         if self.working_im is None:
             logger.debug("Cannot place nail as there is no image!")
             return False
 
+        # Defer clicks faster than the cooldown, so bursts get handled a frame apart
+        now = time.monotonic()
+        if (now - self._last_click_ts) * 1000 < CLICK_COOLDOWN_MS:
+            self.root.after(
+                CLICK_COOLDOWN_MS,
+                functools.partial(self.workspace_click_callback, event),
+            )
+            return True
+        self._last_click_ts = now
+
         canvas_padding = 2
         x = event.x
         y = event.y
@@ -272,91 +457,215 @@ class GUI:
             )
             return False
 
-        if self.active_tool == "Nail":
-            logger.info(f"Placing nail on image at {x, y}")
-            self.place_nail(x, y, priority=len(self.placements) == 0)
-            return True
+        handler = self._click_handlers.get(self.selected_tool)
+        if handler is None:
+            return False
 
-        if self.active_tool == "Erase":
-            logger.info(f"Erasing nail on image at {x, y}")
-            self.erase_nail(x, y)
-            return True
+        handler(x, y)
+        return True
 
-        if self.active_tool == "Prioritize":
-            logger.info(f"Setting priority nail to nail at {x, y}")
-            self.prioritize_nail(x, y)
-            return True
+    def nail_click_callback(self, x: int, y: int) -> None:
+        """
+        Handles a workspace click while the Nail tool is selected
+        :param x: x coordinate of the click
+        :param y: y coordinate of the click
+        :return: None
+        """
+        logger.info(f"Placing nail on image at {x, y}")
+        self.place_nail(x, y, priority=len(self.placements) == 0)
+
+    def erase_click_callback(self, x: int, y: int) -> None:
+        """
+        Handles a workspace click while the Erase tool is selected
+        :param x: x coordinate of the click
+        :param y: y coordinate of the click
+        :return: None
+        """
+        logger.info(f"Erasing nail on image at {x, y}")
+        self.erase_nail(x, y)
+
+    def prioritize_click_callback(self, x: int, y: int) -> None:
+        """
+        Handles a workspace click while the Prioritize tool is selected
+        :param x: x coordinate of the click
+        :param y: y coordinate of the click
+        :return: None
+        """
+        logger.info(f"Setting priority nail to nail at {x, y}")
+        self.prioritize_nail(x, y)
+
+    def workspace_configure_callback(self, event) -> None:
+        """
+        The callback that handles the workspace being resized, invalidates the cached workspace image
+        :param event: The configure event
+        :return: None
+        """
+
+        if self._im_cache_key is None:
+            return
+
+        if (event.width, event.height) != self._im_cache_key[1:]:
+            logger.debug(f"Workspace resized to {event.width, event.height}")
+            self._im_cache_key = None
 
     def get_closest_nail(self, x: int, y: int) -> tuple[int, float]:
         """
-        Returns the index and distance of the closest nail to a given x, y
+        Returns the index and squared distance of the closest nail to a given x, y
         :param x: The x to check against
         :param y: The y to check against
-        :return: A tuple with the index of the closest nail, and the distance to that nail.
+        :return: A tuple with the index of the closest nail, and the squared distance (in canvas pixels) to that nail.
         """
 
-        def distance_to_nail(placement: Placement) -> float:
-            """
-            Calculates the distance to a nail using the x, y passed to get_closest_nail.
-            :param placement: The placement that you want to calculate the distance to.
-            :return: The distance to the nail
-            """
-            x2, y2 = placement.to_scaled(1 / self.im_scale)
-            # distance = sqrt((x2-x1)^2+(y2-y1)^2)
-            return math.sqrt(pow(x2 - x, 2) + pow(y2 - y, 2))
+        if len(self.placements) == 0:
+            # There is no nails, return a null value.
+            return -1, -1.0
+
+        # Compare in image space so the nail coordinates don't need scaling
+        dx = self.placements.xy[:, 0] - x * self.im_scale
+        dy = self.placements.xy[:, 1] - y * self.im_scale
+        d2 = dx * dx + dy * dy
 
-        # Sort the nails
-        cloned = sorted(self.placements.copy(), key=distance_to_nail)
+        idx = int(d2.argmin())
+        return idx, float(d2[idx]) / (self.im_scale * self.im_scale)
 
-        if len(cloned) > 0:
-            idx = self.placements.index(cloned[0])
-            dist = distance_to_nail(self.placements[idx])
-            return idx, dist
+    def redraw_canvas(self, preloaded_im: Union["Image.Image", None] = None) -> None:
+        """
+        Schedules a redraw of the canvas for the next time Tk is idle, multiple calls before then result in one redraw
+        :param preloaded_im: The already opened image at GUI.im_path, used instead of reading the file again
+        :return: None
+        """
 
-        # There is no nails, return a null value.
-        return -1, -1.0
+        if preloaded_im is not None:
+            self._preloaded_im = preloaded_im
+
+        if self._redraw_pending:
+            return
 
-    def redraw_canvas(self):
+        self._redraw_pending = True
+        self.root.after_idle(self._flush_redraw)
+
+    def _flush_redraw(self) -> None:
         """
-        Deletes the canvas element, and redraws the image and nails
-        :return:
+        Runs the pending redraw scheduled by redraw_canvas
+        :return: None
         """
 
+        self._redraw_pending = False
+        self._do_redraw()
+
+    def _do_redraw(self) -> None:
+        """
+        Clears the nails, and redraws the image and nails
+        :return: None
+        """
+
+        from PIL import Image, ImageTk
+
         canvas_width, canvas_height = (
             self.workspace_canvas.winfo_width(),
             self.workspace_canvas.winfo_height(),
         )
-        self.clear_canvas()
+        # The background item is kept and updated below, only the nails are recreated
+        self.workspace_canvas.delete(NAIL_TAG)
+
+        preloaded_im, self._preloaded_im = self._preloaded_im, None
+
+        key = (self.im_path, canvas_width, canvas_height)
+        cache_hit = key == self._im_cache_key
+        if cache_hit:
+            logger.debug("Reusing cached workspace image")
+            self.working_im = self._im_cache_pil
+        else:
+            source = (
+                preloaded_im if preloaded_im is not None else Image.open(self.im_path)
+            )
+            with source:
+                im_width, im_height = source.size
 
-        im = Image.open(self.im_path)
-        im = im.convert(mode="RGBA")
+                # Let the decoder downscale while decoding (JPEG only), leaving headroom
+                # for the resample
+                source.draft("RGB", (canvas_width * 2, canvas_height * 2))
+                im = source.convert(mode="RGBA")
 
-        im_width, im_height = im.size
-        im = scale_to_fit(im, canvas_width, canvas_height)
+        if not cache_hit:
+            im = scale_to_fit(im, canvas_width, canvas_height)
 
-        self.im_scale = max(1.0, im_width / canvas_width)
+            self.set_im_scale(im_width, canvas_width)
 
-        logger.info(f"Image Scale: {self.im_scale}")
+            logger.info(f"Image Scale: {self.im_scale}")
 
-        self.working_im = im
-        tk_im = ImageTk.PhotoImage(self.working_im)
+            self.working_im = im
 
-        self.workspace_frame.workspace_im = tk_im
+            self._im_cache_key = key
+            self._im_cache_pil = self.working_im
 
-        logger.info("Setting workspace canvas image")
+        # Past the threshold one image is far cheaper for Tk than a canvas item per nail
 
-        self.workspace_canvas.create_image(
-            self.working_im.width // 2,
-            0,
-            anchor="n",
-            image=tk_im,
+        bake_nails = len(self.placements) >= NAIL_OVERLAY_THRESHOLD
+        display_im = (
+            self.bake_nails(self.working_im, self.placements)
+            if bake_nails
+            else self.working_im
         )
 
-        for placement in self.placements:
-            self.draw_nail(
-                placement, "#0f0f0f" if not placement.priority else "#2fff2f"
+        if not cache_hit or bake_nails or self._bg_has_nails:
+            # Reuse the existing Tk image when the size allows it instead of a new one
+            if (
+                self._im_cache_tk is not None
+                and (self._im_cache_tk.width(), self._im_cache_tk.height())
+                == display_im.size
+            ):
+                self._im_cache_tk.paste(display_im)
+            else:
+                self._im_cache_tk = ImageTk.PhotoImage(display_im)
+        self._bg_has_nails = bake_nails
+
+        logger.info("Setting workspace canvas image")
+
+        if self._bg_item is None:
+            self._bg_item = self.workspace_canvas.create_image(
+                self.working_im.width // 2,
+                0,
+                anchor="n",
+                image=self._im_cache_tk,
+            )
+        else:
+            self.workspace_canvas.coords(self._bg_item, self.working_im.width // 2, 0)
+            self.workspace_canvas.itemconfigure(self._bg_item, image=self._im_cache_tk)
+
+        if bake_nails:
+            self.placements.dot_id[:] = -1
+        else:
+            self.draw_nails(self.placements)
+
+    def bake_nails(
+        self, image: "Image.Image", placements: PlacementArray
+    ) -> "Image.Image":
+        """
+        Draws nails onto a copy of an image, used instead of canvas items when there are a lot of nails
+        :param image: The workspace image to draw on
+        :param placements: The placements to draw
+        :return: A new PIL Image with the nails drawn on it
+        """
+
+        from PIL import ImageDraw
+
+        image = image.copy()
+        draw = ImageDraw.Draw(image)
+
+        for (px, py), priority in zip(
+            placements.to_canvas(self._scale_num, self._scale_den).tolist(),
+            placements.priority.tolist(),
+        ):
+            color = "#0f0f0f" if not priority else "#2fff2f"
+
+            # The nail using the color, with a black outline
+            draw.ellipse(
+                (px - 3, py - 3, px + 3, py + 3), fill=color, outline="#000000", width=1
             )
 
+        return image
+
     def erase_nail(self, x: int, y: int, safe_zone: int = 6) -> bool:
         """
         Erases a nail within the safe_zone
@@ -366,25 +675,47 @@ class GUI:
         :return: True on success, False on fail
         """
 
-        closest_nail, dist = self.get_closest_nail(x, y)
+        closest_nail, dist_sq = self.get_closest_nail(x, y)
         if closest_nail == -1:
             logger.debug(
                 f"Failed to erase nail at {x, y} as there was no nails in GUI.placements!"
             )
             return False
 
-        if dist > safe_zone:
+        if dist_sq > safe_zone * safe_zone:
             logger.debug(
-                f"Failed to erase nail at {x, y} as the closest nail was {dist:.2f}px away!"
+                f"Failed to erase nail at {x, y} as the closest nail was {math.sqrt(dist_sq):.2f}px away!"
             )
             return False
 
-        selected = self.placements.pop(closest_nail)
+        was_priority = bool(self.placements.priority[closest_nail])
+        dot_id = int(self.placements.dot_id[closest_nail])
+        self.placements.pop(closest_nail)
+
+        # Nails without canvas items are baked into the workspace image
+        baked = dot_id == -1
+        if not baked:
+            self.workspace_canvas.delete(dot_id)
+
+        # Keep GUI.priority_nail pointing at the priority nail now the indexes shifted
+        if was_priority:
+            self.priority_nail = 0
+        elif closest_nail < self.priority_nail:
+            self.priority_nail -= 1
 
-        if selected.priority and len(self.placements) > 0:
-            self.placements[0].priority = True
+        if was_priority and len(self.placements) > 0:
+            self.placements.priority[0] = True
+
+            first_dot_id = int(self.placements.dot_id[0])
+            if first_dot_id != -1:
+                self.workspace_canvas.itemconfigure(first_dot_id, fill="#2fff2f")
+            else:
+                baked = True
+
+        if baked:
+            # The nail is part of the workspace image, it has to be rebuilt without it
+            self.redraw_canvas()
 
-        self.redraw_canvas()
         return True
 
     def place_nail(self, x: int, y: int, priority: bool = False) -> None:
@@ -395,11 +726,11 @@ class GUI:
         :param priority: Whether the nail is the priority nail
         :return: None
         """
-        placement = Placement(
+        idx = self.placements.append(
             x=round(x * self.im_scale), y=round(y * self.im_scale), priority=priority
         )
-        if self.draw_nail(placement, "#0f0f0f" if not priority else "#2fff2f"):
-            self.placements.append(placement)
+        if not self.draw_nail(idx, "#0f0f0f" if not priority else "#2fff2f"):
+            self.placements.pop(idx)
 
     def prioritize_nail(self, x: int, y: int, safe_zone: int = 6) -> bool:
         """
@@ -410,61 +741,109 @@ class GUI:
         :return: True on success, False on failure
         """
 
-        closest_nail, dist = self.get_closest_nail(x, y)
+        closest_nail, dist_sq = self.get_closest_nail(x, y)
         if closest_nail == -1:
             logger.debug(
                 f"Failed to prioritize nail at {x, y} as there was no nails in GUI.placements!"
             )
             return False
 
-        if dist > safe_zone:
+        if dist_sq > safe_zone * safe_zone:
             logger.debug(
-                f"Failed to prioritize nail at {x, y} as the closest nail is {dist:.2f}px away!"
+                f"Failed to prioritize nail at {x, y} as the closest nail is {math.sqrt(dist_sq):.2f}px away!"
             )
             return False
 
-        self.placements[self.priority_nail].priority = False
-        self.placements[closest_nail].priority = True
+        old_dot_id = int(self.placements.dot_id[self.priority_nail])
+        new_dot_id = int(self.placements.dot_id[closest_nail])
+
+        self.placements.priority[self.priority_nail] = False
+        self.placements.priority[closest_nail] = True
         self.priority_nail = closest_nail
 
-        self.redraw_canvas()
+        if old_dot_id == -1 or new_dot_id == -1:
+            # At least one of them is baked into the workspace image
+            self.redraw_canvas()
+            return True
+
+        # Only these two nails change color, recolor them instead of redrawing
+        self.workspace_canvas.itemconfigure(old_dot_id, fill="#0f0f0f")
+        self.workspace_canvas.itemconfigure(new_dot_id, fill="#2fff2f")
+        # Keep the priority nail visible above any nails overlapping it
+        self.workspace_canvas.tag_raise(new_dot_id)
+
+        return True
 
     def draw_nail(
-        self, placement: Placement, color: str, scale_factor: float | None = None
+        self, idx: int, color: str, scale_factor: float | None = None
     ) -> bool:
         """
         Draws a nail on the canvas.
-        :param placement: The placement object to place
+        :param idx: The index of the nail in GUI.placements
         :param color: Color of the nail (tkinter colors)
         :param scale_factor: The factor to scale the nail by, leave as None to use GUI.im_scale
-        :return:
+        :return: True on success, False on fail
         """
         if self.workspace_canvas is None:
             logger.warning("Cannot place a nail as there is no workspace_canvas!")
             return False
 
-        scale = scale_factor or 1 / self.im_scale
+        x, y = self.placements.xy[idx].tolist()
+        if scale_factor is None:
+            num, den = self._scale_num, self._scale_den
+            px, py = (x * num + den // 2) // den, (y * num + den // 2) // den
+        else:
+            px, py = round(x * scale_factor), round(y * scale_factor)
 
-        px, py = placement.to_scaled(scale)
-
-        # Draw the black outline
-        self.workspace_canvas.create_oval(
+        # Draw the nail using the color, with a black outline
+        self.placements.dot_id[idx] = self.workspace_canvas.create_oval(
             px - 3,
             py - 3,
             px + 3,
             py + 3,
-            fill="#000000",
-        )
-        # Draw the nail using the color
-        self.workspace_canvas.create_oval(
-            px - 2,
-            py - 2,
-            px + 2,
-            py + 2,
             fill=color,
+            outline="#000000",
+            width=1,
+            tags=NAIL_TAG,
         )
         return True
 
+    def draw_nails(self, placements: PlacementArray) -> None:
+        """
+        Draws many nails on the canvas at once, the same as calling draw_nail for each but in a single Tcl call
+        :param placements: The placements to draw
+        :return: None
+        """
+        if self.workspace_canvas is None:
+            logger.warning("Cannot place nails as there is no workspace_canvas!")
+            return
+
+        import numpy as np
+
+        canvas = str(self.workspace_canvas)
+
+        cmds = []
+        for (px, py), priority in zip(
+            placements.to_canvas(self._scale_num, self._scale_den).tolist(),
+            placements.priority.tolist(),
+        ):
+            color = "#0f0f0f" if not priority else "#2fff2f"
+
+            # The nail using the color, with a black outline
+            cmds.append(
+                f"[{canvas} create oval {px - 3} {py - 3} {px + 3} {py + 3} "
+                f"-fill {color} -outline #000000 -width 1 -tags {NAIL_TAG}]"
+            )
+
+        if not cmds:
+            return
+
+        # Wrapping the commands in a list gets every item id back from the one call
+        placements.dot_id[:] = np.array(
+            self.root.tk.splitlist(self.root.tk.eval("list " + " ".join(cmds))),
+            dtype=np.int64,
+        )
+
     def draw_toolbar(self) -> None:
         """
         Draws the toolbar for the application
@@ -484,19 +863,6 @@ class GUI:
         seperator = tk.Frame(self.root, bg="#000000", height=1)
         seperator.grid(row=1, column=0, columnspan=len(TOOLS), sticky="ew")
 
-    def clear_canvas(self) -> None:
-        """
-        Clears the canvas
-        :return: None
-        """
-
-        self.workspace_canvas.destroy()
-
-        canvas = tk.Canvas(master=self.workspace_frame)
-        canvas.bind("<Button-1>", self.workspace_click_callback)
-        canvas.pack(expand=True, fill="both", padx=0, pady=0)
-        self.workspace_canvas = canvas
-
     def draw_workspace(self) -> None:
         """
         Draws the workspace frames
@@ -514,6 +880,7 @@ class GUI:
 
         canvas = tk.Canvas(master=workspace_frame)
         canvas.bind("<Button-1>", self.workspace_click_callback)
+        canvas.bind("<Configure>", self.workspace_configure_callback)
         canvas.pack(expand=True, fill="both", padx=0, pady=0)
         self.workspace_canvas = canvas
 
@@ -1,7 +1,19 @@
+import base64
+import json
 import logging
+from typing import TYPE_CHECKING
+
+# numpy is imported where it's used so the window can open before it has loaded
+if TYPE_CHECKING:
+    import numpy as np
 
 logger = logging.getLogger("placements.py")
 
+# Little endian int32 rows of (x, y, priority) for the binary pins format
+PIN_DTYPE = "<i4"
+# Written as pins_v next to pins_b64, bumped whenever the binary layout changes
+PIN_VERSION = "2"
+
 
 class PlacementLoadError(BaseException):
     def __init__(self, msg: str):
@@ -14,52 +26,145 @@ class PlacementLoadError(BaseException):
         return self.msg
 
 
-class Placement:
-    def __init__(self, x: int, y: int, priority: bool):
-        self.x: float = x
-        self.y: float = y
-        self.priority: bool = priority
+class PlacementArray:
+    # One row per nail across parallel arrays, so bulk operations are single numpy calls
+    def __init__(
+        self, xy: "np.ndarray | None" = None, priority: "np.ndarray | None" = None
+    ):
+        import numpy as np
+
+        self.xy: np.ndarray = (
+            np.empty((0, 2), dtype=np.int32) if xy is None else xy.astype(np.int32)
+        )
+        self.priority: np.ndarray = (
+            np.zeros(len(self.xy), dtype=bool)
+            if priority is None
+            else priority.astype(bool)
+        )
+
+        # Canvas item id of each drawn nail, -1 while it isn't drawn as a canvas item
+        self.dot_id: np.ndarray = np.full(len(self.xy), -1, dtype=np.int64)
+
+        # The last to_canvas result, the scale only changes when the image does
+        self._scaled_key: tuple[int, int] | None = None
+        self._scaled_cache: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        return len(self.xy)
+
+    def append(self, x: int, y: int, priority: bool) -> int:
+        import numpy as np
+
+        self.xy = np.append(self.xy, np.array([[x, y]], dtype=np.int32), axis=0)
+        self.priority = np.append(self.priority, priority)
+        self.dot_id = np.append(self.dot_id, -1)
+        self._scaled_key = None
+        return len(self.xy) - 1
+
+    def pop(self, idx: int) -> None:
+        import numpy as np
+
+        self.xy = np.delete(self.xy, idx, axis=0)
+        self.priority = np.delete(self.priority, idx)
+        self.dot_id = np.delete(self.dot_id, idx)
+        self._scaled_key = None
+
+    def clear(self) -> None:
+        self.__init__()
+
+    def copy(self) -> "PlacementArray":
+        # The canvas item ids aren't copied, the copy isn't drawn yet
+        return PlacementArray(xy=self.xy, priority=self.priority)
+
+    def to_canvas(self, num: int, den: int) -> "np.ndarray":
+        # Scales by num / den with integer math, rounding halves up
+        import numpy as np
 
-    def to_scaled(self, scale: float):
-        return round(self.x * scale), round(self.y * scale)
+        key = (num, den)
+        if key != self._scaled_key:
+            self._scaled_cache = (self.xy.astype(np.int64) * num + den // 2) // den
+            self._scaled_key = key
+        return self._scaled_cache
 
 
-def placements_from_json(placements: list) -> list[Placement]:
-    def log_and_raise(msg: str):
-        logger.warning(msg)
-        raise PlacementLoadError(msg)
+def log_and_raise(msg: str):
+    logger.warning(msg)
+    raise PlacementLoadError(msg)
+
+
+def placements_from_json(placements: list) -> PlacementArray:
+    import numpy as np
 
     if not isinstance(placements, list):
         log_and_raise("Error loading placements, data is not a list!")
 
-    new_placements: list[Placement] = []
+    # Checked first so short data never reaches the conversion
+    if len(placements) < 3:
+        log_and_raise("Error loading placements, not enough points!")
+
+    # Validate the whole structure with one conversion instead of checking each value
+    try:
+        arr = np.asarray(placements)
+    except (ValueError, TypeError):
+        log_and_raise("Error loading placements, data[i] has incorrect length!")
+
+    if arr.ndim != 2 or arr.shape[1] != 3:
+        log_and_raise("Error loading placements, data[i] has incorrect length!")
+
+    if arr.dtype.kind not in "biu":
+        log_and_raise("Error loading placements, data[i][j] is not an integer!")
+
+    # Nails are stored as int32, anything outside that would silently wrap
+    int32 = np.iinfo(np.int32)
+    if arr.min() < int32.min or arr.max() > int32.max:
+        log_and_raise("Error loading placements, data[i][j] is out of range!")
 
-    for placement in placements:
-        if not isinstance(placement, list):
-            log_and_raise("Error loading placements, data[i] is not a list!")
+    return PlacementArray(xy=arr[:, :2], priority=arr[:, 2])
 
-        if len(placement) != 3:
-            log_and_raise("Error loading placements, data[i][j] has incorrect length!")
 
-        for value in placement:
-            if not isinstance(value, int):
-                log_and_raise("Error loading placements, data[i][j] is not an integer!")
+def placements_from_bytes(data: bytes) -> PlacementArray:
+    import numpy as np
 
-        x, y, priority = placement
-        new_placements.append(Placement(x=x, y=y, priority=priority))
+    if len(data) % (3 * np.dtype(PIN_DTYPE).itemsize) != 0:
+        log_and_raise("Error loading placements, data has incorrect length!")
 
-    if len(new_placements) < 3:
+    arr = np.frombuffer(data, dtype=PIN_DTYPE).reshape(-1, 3)
+
+    if len(arr) < 3:
         log_and_raise("Error loading placements, not enough points!")
 
-    return new_placements
+    return PlacementArray(xy=arr[:, :2], priority=arr[:, 2])
+
+
+def placements_to_bytes(placements: PlacementArray, num: int, den: int) -> bytes:
+    import numpy as np
+
+    return (
+        np.column_stack((placements.to_canvas(num, den), placements.priority))
+        .astype(PIN_DTYPE)
+        .tobytes()
+    )
+
+
+def placements_from_info(info: dict) -> PlacementArray:
+    # Reads the pins from an exported image's metadata, in either format
+    if "pins_b64" in info:
+        version = info.get("pins_v")
+        if version != PIN_VERSION:
+            log_and_raise(
+                f"Error loading placements, unsupported pins version {version}!"
+            )
 
+        return placements_from_bytes(base64.b64decode(info["pins_b64"]))
 
-def placements_to_json(
-    placements: list[Placement], descale_factor: float
-) -> list[list]:
-    data = []
+    if "pins" not in info:
+        log_and_raise("Error loading placements, the image has no pins!")
 
-    for placement in placements:
-        data.append([*placement.to_scaled(descale_factor), placement.priority])
+    # Saved before the binary format, the pins are JSON.
+    # orjson is optional, it's much faster at parsing them but json works the same
+    try:
+        from orjson import loads as json_loads
+    except ImportError:
+        json_loads = json.loads
 
-    return data
+    return placements_from_json(json_loads(info["pins"]))